@@ -15,13 +15,25 @@
 - Адаптивный таймаут (90 сек для RESUME)
 """
 
+import hashlib
+import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+from enum import IntEnum
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
-from urllib.parse import quote
+
+# orjson (C-реализация) заметно быстрее stdlib json на ARM, но опционален
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # ========== КОНФИГУРАЦИЯ ==========
 
@@ -37,9 +49,15 @@ PRINTER_GROUP = "1.1"
 # Интервал проверки (в секундах)
 CHECK_INTERVAL = 60
 
+# Печатать ли весь график в лог после обновления (можно выключить на слабых SD)
+LOG_SCHEDULE_DUMP = True
+
 # Сколько минут ждать ПЕРЕД отключением
 WAIT_BEFORE = 5
 
+# То же в часах - считаем один раз при загрузке модуля
+_WAIT_BEFORE_HOURS = WAIT_BEFORE / 60.0
+
 # Сколько минут ждать ПІСЛЯ паузы перед RESUME
 WAIT_AFTER = 10
 
@@ -50,6 +68,12 @@ WAIT_AFTER = 10
 EXTRUDER_TEMP = 200  # 🔥 Температура екструдера (°C)
 BED_TEMP = 60        # 🛏️ Температура столу (°C)
 
+# Кеш розкладу ДТЕК (ETag + останні дані) - щоб не качати той самий JSON щодня
+CACHE_FILE = Path("printer_power_manager_cache.json")
+
+# Стан паузи на диску - щоб рестарт демона під час відключення не забув RESUME
+STATE_FILE = Path("printer_power_manager.state.json")
+
 # Логирование ТОЛЬКО в файл (без дублирования на stdout)
 LOG_FILE = Path("printer_power_manager.log")
 logging.basicConfig(
@@ -62,23 +86,104 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _make_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """HTTPAdapter з обмеженим пулом та авто-повтором на тимчасові збої"""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+
 class DTEKOutageManager:
     """Менеджер для роботи з графіком відключень ДТЕК"""
 
     def __init__(self, group: str = "1.1"):
         self.group = group
-        self.outages: Dict[str, List[Tuple[float, float]]] = {}
+        # Слоти: (start_hours, end_hours, pause_point_hours, "HH:MM-HH:MM")
+        self.outages: Dict[str, List[Tuple[float, float, float, str]]] = {}
         self.last_update = None
+        # Постійна сесія: keep-alive до app.yasno.ua замість нового TLS на кожен запит
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": "printer-power-manager/1.0",
+            "Accept": "application/json"
+        })
+        # Маленький пул - нам треба лише один хост
+        self.session.mount("https://", _make_adapter(pool_connections=2, pool_maxsize=4))
+        self._etag = None
+        self._last_modified = None
+        self._last_body_hash = None
+        self._load_cache()
         logger.info(f"🔌 DTEKOutageManager ініціалізовано для групи {group}")
 
+    def _load_cache(self) -> None:
+        """Відновити кешований розклад та ETag з диска (якщо є)"""
+        try:
+            if CACHE_FILE.exists():
+                cache = json.loads(CACHE_FILE.read_text())
+                self._etag = cache.get("etag")
+                self._last_modified = cache.get("last_modified")
+                self.outages = {
+                    period: [tuple(slot) for slot in slots]
+                    for period, slots in cache.get("outages", {}).items()
+                }
+                logger.info(f"💾 Кеш розкладу завантажено (ETag: {self._etag})")
+        except Exception as e:
+            logger.warning(f"⚠️  Не вдалось прочитати кеш: {e}")
+
+    def _save_cache(self) -> None:
+        """Зберегти розклад та ETag на диск"""
+        try:
+            cache = {
+                "etag": self._etag,
+                "last_modified": self._last_modified,
+                "outages": self.outages
+            }
+            CACHE_FILE.write_text(json.dumps(cache))
+        except Exception as e:
+            logger.warning(f"⚠️  Не вдалось записати кеш: {e}")
+
     def fetch_outages(self) -> bool:
         """Отримати графік відключень з API ДТЕК"""
         try:
             logger.info(f"📡 Завантажую розклад з ДТЕК...")
-            response = requests.get(DTEK_API, timeout=10)
-            response.raise_for_status()
 
-            data = response.json()
+            # Умовний GET: якщо розклад не змінився, сервер відповість 304 без тіла
+            headers = {}
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+            # (connect, read): мертвий хост відпадає за 3 сек, а не за 10
+            response = self.session.get(DTEK_API, headers=headers, timeout=(3, 10))
+
+            if response.status_code == 304 and self.outages:
+                logger.info("✅ Розклад не змінився (304), використовую кеш")
+                self.last_update = datetime.now()
+                return True
+
+            if response.status_code != 200:
+                logger.error(f"❌ ДТЕК API відповів {response.status_code}")
+                return False
+
+            # Якщо сервер не шле ETag: хеш тіла ловить незмінений payload
+            # і економить повторний json-парсинг
+            body = response.content
+            body_hash = hashlib.sha1(body).digest()
+            if body_hash == self._last_body_hash and self.outages:
+                logger.info("✅ Payload не змінився, пропускаю парсинг")
+                self.last_update = datetime.now()
+                return True
+
+            data = _json_loads(body)
 
             if self.group not in data:
                 logger.error(f"❌ Група {self.group} не знайдена в API")
@@ -93,12 +198,15 @@ class DTEKOutageManager:
             }
 
             self.last_update = datetime.now()
+            self._last_body_hash = body_hash
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._save_cache()
             logger.info(f"✅ Розклад оновлено")
-            for period in ["today", "tomorrow"]:
-                for start, end in self.outages[period]:
-                    start_str = f"{int(start):02d}:{int((start % 1) * 60):02d}"
-                    end_str = f"{int(end):02d}:{int((end % 1) * 60):02d}"
-                    logger.info(f"   {period.upper()}: 🔴 {start_str} - {end_str}")
+            if LOG_SCHEDULE_DUMP:
+                for period in ["today", "tomorrow"]:
+                    for _start, _end, _pause_point, window_name in self.outages[period]:
+                        logger.info("   %s: 🔴 %s", period.upper(), window_name)
             return True
 
         except Exception as e:
@@ -106,8 +214,11 @@ class DTEKOutageManager:
             return False
 
     @staticmethod
-    def _parse_slots(slots: List[Dict]) -> List[Tuple[float, float]]:
-        """Парсимо слоти (беремо ТІЛЬКИ Definite)"""
+    def _parse_slots(slots: List[Dict]) -> List[Tuple[float, float, float, str]]:
+        """Парсимо слоти (беремо ТІЛЬКИ Definite)
+
+        Точку паузи та назву вікна рахуємо ОДИН раз тут, а не на кожному тіку.
+        """
         outages = []
         for slot in slots:
             if slot.get("type") == "Definite":
@@ -117,37 +228,46 @@ class DTEKOutageManager:
                 start_hours = start_minutes / 60
                 end_hours = end_minutes / 60
 
-                outages.append((start_hours, end_hours))
+                # Точка паузи = WAIT_BEFORE хвилин ДО початку вікна
+                pause_point = start_hours - _WAIT_BEFORE_HOURS
+                window_name = (
+                    f"{int(start_hours):02d}:{int((start_hours % 1) * 60):02d}-"
+                    f"{int(end_hours):02d}:{int((end_hours % 1) * 60):02d}"
+                )
+
+                outages.append((start_hours, end_hours, pause_point, window_name))
 
-        return outages
+        # Сортуємо за початком: перше НЕзакінчене вікно = відповідь,
+        # далі можна не дивитись
+        return sorted(outages, key=lambda slot: slot[0])
 
-    def get_current_period(self) -> str:
+    def get_current_period(self, now: Optional[datetime] = None) -> str:
         """Визначити сьогодні чи завтра"""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         if now.hour == 23:
             return "tomorrow"
         return "today"
 
-    def get_next_danger_window(self) -> Tuple[bool, Optional[str], Optional[float]]:
+    def get_next_danger_window(self, now: Optional[datetime] = None) -> Tuple[bool, Optional[str], Optional[float]]:
         """
         Перевірити найближче небезпечне вікно з урахуванням WAIT_BEFORE
+        Приймає опціональний `now`, щоб весь тік рахувався від одного моменту.
         Повертає:
         - is_approaching: чи ЗАРАЗ треба паузити (залишилось <= 1 хвилина до точки паузи)
         - window_name: назва вікна (напр. "16:00-19:00")
         - minutes_until_pause: хвилини до ТОЧКИ ПАУЗИ (не до початку вікна!)
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_hour = now.hour + now.minute / 60
 
-        period = self.get_current_period()
+        period = self.get_current_period(now)
         outages = self.outages.get(period, [])
 
-        for start, end in outages:
-            # Точка паузи = WAIT_BEFORE хвилин ДО початку вікна
-            pause_point = start - (WAIT_BEFORE / 60)
-            
-            window_name = f"{int(start):02d}:{int((start % 1) * 60):02d}-{int(end):02d}:{int((end % 1) * 60):02d}"
-
+        # Слоти відсортовані за початком - зупиняємось на першому,
+        # що ще не закінчився
+        for start, end, pause_point, window_name in outages:
             # Якщо ми ще ПЕРЕД точкою паузи
             if current_hour < pause_point:
                 minutes_until_pause = (pause_point - current_hour) * 60
@@ -169,33 +289,61 @@ class DTEKOutageManager:
 
         return False, None, None
 
+    def seconds_until_next_action(self) -> float:
+        """Скільки секунд до найближчої точки паузи (3600, якщо вікон немає)"""
+        now = datetime.now()
+        current_hour = now.hour + now.minute / 60
+
+        period = self.get_current_period()
+        for _start, end, pause_point, _window_name in self.outages.get(period, []):
+            if current_hour < pause_point:
+                return (pause_point - current_hour) * 3600
+            if current_hour < end:
+                # Ми вже у вікні - діяти треба негайно
+                return 0.0
+
+        return 3600.0
+
 
 class MoonrakerClient:
     """Клієнт для керування принтером через Moonraker HTTP API"""
 
     def __init__(self, base_url: str = MOONRAKER_BASE):
         self.base_url = base_url
+        self._script_url = f"{base_url}/printer/gcode/script"
         self.session = requests.Session()
+        # Один хост (локальний Moonraker) - один keep-alive сокет
+        self.session.mount("http://", _make_adapter(pool_connections=1, pool_maxsize=2))
         logger.info(f"🖨️  Moonraker: {base_url}")
 
+        # Прогріваємо keep-alive сокет, щоб перший (аварійний!) PAUSE
+        # не платив за TCP handshake
+        try:
+            self.session.get(f"{base_url}/server/info", timeout=3)
+            logger.info("✅ Moonraker доступний (з'єднання прогріте)")
+        except Exception as e:
+            logger.warning(f"⚠️  Moonraker недоступний при старті: {e}")
+
     def _call_script(self, script: str) -> bool:
         """Выполнить gcode скрипт через HTTP GET"""
         try:
-            url = f"{self.base_url}/printer/gcode/script?script={quote(script)}"
-            logger.debug(f"  URL: {url}")
-            
-            # Разные таймауты для разных команд
+            # Ліниве форматування: рядок не будується, якщо DEBUG вимкнено
+            logger.debug("  Script: %s", script)
+
+            # Разные таймауты чтения для разных команд
             # RESUME может ждать прогрева экструдера - до 90 секунд
-            # Остальное - 15 секунд
-            if "RESUME" in script or "M104" in script or "M140" in script:
-                timeout = 90
+            # Остальное - 15 секунд. Connect всегда 3 сек: мёртвый
+            # Moonraker отваливается быстро, а не висит 90 секунд
+            if ("RESUME" in script or "M104" in script or "M140" in script
+                    or "M109" in script or "M190" in script):
+                timeout = (3, 90)
             else:
-                timeout = 15
+                timeout = (3, 15)
             
-            response = self.session.get(url, timeout=timeout)
+            response = self.session.get(self._script_url, params={"script": script}, timeout=timeout)
             response.raise_for_status()
             
-            logger.debug(f"  Status: {response.status_code}")
+            logger.debug("  Status: %s", response.status_code)
             return True
 
         except Exception as e:
@@ -207,24 +355,25 @@ class MoonrakerClient:
         logger.warning("⏸️  ПАУЗУ ДРУК!")
         return self._call_script("PAUSE")
 
+    def pause_and_park(self) -> bool:
+        """Пауза + припаркування (40°C) одним скриптом
+
+        G4 P1000 чекає на боці MCU - без time.sleep() у Python
+        і без другого HTTP запиту
+        """
+        logger.warning("⏸️  ПАУЗУ ДРУК + припаркування (40°C)!")
+        return self._call_script("PAUSE\nG4 P1000\nM140 S40\nM104 S40")
+
     def resume_print(self) -> bool:
         """Відновити друк (з включенням нагрівачів)"""
         logger.info("▶️  ВІДНОВЛЮЮ ДРУК!")
-        
-        # 1. Спочатку включаємо нагрівачі
-        logger.info(f"🔥 Включаю нагрівачі: екструдер {EXTRUDER_TEMP}°C, стіл {BED_TEMP}°C")
-        gcode_heat = f"M104 S{EXTRUDER_TEMP}\nM140 S{BED_TEMP}"
-        if not self._call_script(gcode_heat):
-            logger.warning("⚠️  Помилка при включенні нагрівачів")
-            return False
-        
-        # 2. Чекаємо поки нагрівачі прогріються (до 90 сек)
-        logger.info("⏳ Чекаю прогрів нагрівачів (до 90 сек)...")
-        time.sleep(2)
-        
-        # 3. Робимо RESUME
-        logger.info("▶️  Запускаю RESUME...")
-        return self._call_script("RESUME")
+
+        # Один скрипт: M190/M109 БЛОКУЮТЬ до досягнення температури,
+        # тож RESUME стартує рівно тоді, коли прогрів завершено
+        logger.info(f"🔥 Грію до цілі: екструдер {EXTRUDER_TEMP}°C, стіл {BED_TEMP}°C")
+        logger.info("▶️  Запускаю RESUME (після прогріву)...")
+        gcode = f"M190 S{BED_TEMP}\nM109 S{EXTRUDER_TEMP}\nRESUME"
+        return self._call_script(gcode)
 
     def set_heaters_off(self) -> bool:
         """Припаркувати принтер - охолодити до 40°C"""
@@ -234,15 +383,37 @@ class MoonrakerClient:
         return self._call_script(gcode)
 
 
+class State(IntEnum):
+    """Явні стани керування принтером (замість одного is_paused)"""
+    IDLE = 0            # друкуємо, вікон поблизу немає
+    PAUSING = 1         # треба поставити паузу (PAUSE ще не пройшов)
+    PAUSED_WAITING = 2  # на паузі, чекаємо WAIT_AFTER
+    RESUMING = 3        # час відновлювати друк
+    RECOVERY = 4        # RESUME не вдався, повторюємо з backoff
+
+
 class PrinterPowerManager:
     """Основний менеджер керування живленням принтера"""
 
     def __init__(self):
         self.dtek = DTEKOutageManager(PRINTER_GROUP)
         self.moonraker = MoonrakerClient(MOONRAKER_BASE)
-        self.is_paused = False
+        self.state = State.IDLE
         self.pause_start_time = None
         self.current_outage = None
+        self._next_resume_retry = None
+        self._resume_retry_minutes = 1
+        self._fetch_backoff_minutes = 1
+        self._load_state()
+
+        # Диспетчеризація по стану замість вкладених if/elif
+        self._dispatch = {
+            State.IDLE: self._tick_idle,
+            State.PAUSING: self._tick_pausing,
+            State.PAUSED_WAITING: self._tick_waiting,
+            State.RESUMING: self._tick_resuming,
+            State.RECOVERY: self._tick_recovery,
+        }
 
         logger.info(f"🖨️  PrinterPowerManager запущено")
         logger.info(f"⚙️  wait_before={WAIT_BEFORE} хвилин, wait_after={WAIT_AFTER} хвилин")
@@ -250,73 +421,121 @@ class PrinterPowerManager:
         logger.info(f"🛏️  Припаркування: 40°C (середня температура)")
         logger.info(f"📍 Moonraker: {MOONRAKER_BASE}")
 
-    def update_outages(self) -> None:
+    def _save_state(self) -> None:
+        """Атомарно зберегти стан на диск (на кожному переході)"""
+        try:
+            state = {
+                "state": self.state.name,
+                "pause_start_time": self.pause_start_time.isoformat() if self.pause_start_time else None,
+                "current_outage": self.current_outage
+            }
+            tmp_file = STATE_FILE.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(state))
+            os.replace(tmp_file, STATE_FILE)
+        except Exception as e:
+            logger.warning(f"⚠️  Не вдалось зберегти стан: {e}")
+
+    def _load_state(self) -> None:
+        """Відновити стан після рестарту (якщо файл є)"""
+        try:
+            if STATE_FILE.exists():
+                state = json.loads(STATE_FILE.read_text())
+                self.state = State[state.get("state", "IDLE")]
+                pause_time = state.get("pause_start_time")
+                self.pause_start_time = datetime.fromisoformat(pause_time) if pause_time else None
+                self.current_outage = state.get("current_outage")
+                if self.state != State.IDLE:
+                    logger.warning(f"💾 Відновлено стан {self.state.name}: пауза з {pause_time} (вікно {self.current_outage})")
+        except Exception as e:
+            logger.warning(f"⚠️  Не вдалось прочитати стан: {e}")
+
+    def update_outages(self) -> bool:
         """Оновити розклад відключень (в 00:00)"""
-        self.dtek.fetch_outages()
+        return self.dtek.fetch_outages()
 
     def check_and_manage(self) -> None:
-        """Основна функція - перевіряти та керувати принтером"""
-        
-        is_approaching, window_name, minutes_until = self.dtek.get_next_danger_window()
+        """Основна функція - один тік стейт-машини"""
+
+        # Один момент часу на весь тік - без повторних викликів datetime.now()
+        now = datetime.now()
+        self._dispatch[self.state](now)
 
-        if is_approaching and not self.is_paused:
-            # ===== РЕЖИМ 1: PAUSE =====
+    def _tick_idle(self, now: datetime) -> None:
+        """IDLE: друкуємо, дивимось чи не наближається вікно"""
+        is_approaching, window_name, minutes_until = self.dtek.get_next_danger_window(now)
+
+        if is_approaching:
             logger.critical(f"⚠️  НЕБЕЗПЕЧНЕ ВІКНО БЛИЗЬКО: {window_name}")
             logger.critical(f"🛑 Ставлю друк на паузу (wait_before={WAIT_BEFORE} хвилин)")
+            self.current_outage = window_name
+            self.state = State.PAUSING
+            self._tick_pausing(now)
+
+    def _tick_pausing(self, now: datetime) -> None:
+        """PAUSING: PAUSE ще не пройшов - пробуємо (і повторюємо на кожному тіку)"""
+        if self.moonraker.pause_and_park():
+            self.pause_start_time = now
+            self.state = State.PAUSED_WAITING
+            self._save_state()
+
+            logger.warning(f"⏸️  Друк на паузі")
+            logger.info(f"📍 RESUME буде через {WAIT_AFTER} хвилин")
+
+    def _tick_waiting(self, now: datetime) -> None:
+        """PAUSED_WAITING: чекаємо WAIT_AFTER хвилин перед RESUME"""
+        time_paused = (now - self.pause_start_time).total_seconds() / 60
+
+        if time_paused >= WAIT_AFTER:
+            logger.info(f"✅ wait_after={WAIT_AFTER} хвилин пройшло!")
+            self.state = State.RESUMING
+            self._tick_resuming(now)
+        else:
+            logger.debug("⏳ На паузі %.1f хв з %s. Чекаю ще %.1f хв",
+                         time_paused, WAIT_AFTER, WAIT_AFTER - time_paused)
 
-            if self.moonraker.pause_print():
-                self.is_paused = True
-                self.pause_start_time = datetime.now()
-                self.current_outage = window_name
-
-                time.sleep(1)
-                self.moonraker.set_heaters_off()
-
-                logger.warning(f"⏸️  Друк на паузі")
-                logger.info(f"📍 RESUME буде через {WAIT_AFTER} хвилин")
-
-        elif self.is_paused:
-            # ===== РЕЖИМ 2: ЧЕКАЄМО WAIT_AFTER =====
-            time_paused = (datetime.now() - self.pause_start_time).total_seconds() / 60
-
-            if time_paused >= WAIT_AFTER:
-                # Час вийшов - робимо RESUME
-                logger.info(f"✅ wait_after={WAIT_AFTER} хвилин пройшло!")
-                logger.info(f"▶️  Намагаюсь RESUME...")
-
-                if self.moonraker.resume_print():
-                    self.is_paused = False
-                    self.pause_start_time = None
-                    self.current_outage = None
-                    logger.info("✅ Друк успішно відновлено!")
-                else:
-                    logger.warning("⚠️  RESUME не вдав, буду спробувати ще раз")
-            else:
-                # Ще чекаємо
-                minutes_left_wait = WAIT_AFTER - time_paused
-                logger.debug(f"⏳ На паузі {time_paused:.1f} хв з {WAIT_AFTER}. Чекаю ще {minutes_left_wait:.1f} хв")
+    def _tick_resuming(self, now: datetime) -> None:
+        """RESUMING: пробуємо RESUME; невдача -> RECOVERY з backoff"""
+        logger.info(f"▶️  Намагаюсь RESUME...")
+
+        if self.moonraker.resume_print():
+            self.state = State.IDLE
+            self.pause_start_time = None
+            self.current_outage = None
+            self._resume_retry_minutes = 1
+            self._next_resume_retry = None
+            self._save_state()
+            logger.info("✅ Друк успішно відновлено!")
+        else:
+            self.state = State.RECOVERY
+            self._next_resume_retry = now + timedelta(minutes=self._resume_retry_minutes)
+            logger.warning(f"⚠️  RESUME не вдав, повтор через {self._resume_retry_minutes} хв")
+
+    def _tick_recovery(self, now: datetime) -> None:
+        """RECOVERY: повторюємо RESUME з експоненційним backoff (1, 2, 4... хв)"""
+        if self._next_resume_retry and now < self._next_resume_retry:
+            return
+
+        self._resume_retry_minutes = min(10, self._resume_retry_minutes * 2)
+        self._tick_resuming(now)
 
     def run_daemon(self) -> None:
         """Запустити у режимі демона (постійна робота)"""
         logger.info("🚀 Запускаю PrinterPowerManager демон...")
         logger.info(f"📍 Група ДТЕК: {PRINTER_GROUP}")
 
-        self.update_outages()
-
-        next_update = self._get_next_midnight()
+        next_update = self._schedule_next_update(self.update_outages())
 
         while True:
             try:
                 current_time = datetime.now()
 
                 if current_time >= next_update:
-                    logger.info("🔄 Оновлюю розклад о 00:00...")
-                    self.update_outages()
-                    next_update = self._get_next_midnight()
+                    logger.info("🔄 Оновлюю розклад...")
+                    next_update = self._schedule_next_update(self.update_outages())
 
                 self.check_and_manage()
 
-                time.sleep(CHECK_INTERVAL)
+                time.sleep(self._next_sleep_interval())
 
             except KeyboardInterrupt:
                 logger.info("⏹️  PrinterPowerManager зупинено")
@@ -325,6 +544,32 @@ class PrinterPowerManager:
                 logger.error(f"❌ Помилка в main loop: {e}")
                 time.sleep(CHECK_INTERVAL)
 
+    def _schedule_next_update(self, fetch_ok: bool) -> datetime:
+        """Коли пробувати оновити розклад наступного разу.
+
+        Успіх -> наступна північ. Невдача -> експоненційний backoff
+        1, 2, 4... до 60 хвилин, щоб не сидіти добу без розкладу.
+        """
+        if fetch_ok:
+            self._fetch_backoff_minutes = 1
+            return self._get_next_midnight()
+
+        retry_in = self._fetch_backoff_minutes
+        self._fetch_backoff_minutes = min(60, self._fetch_backoff_minutes * 2)
+        logger.warning(f"⚠️  Розклад не отримано, повтор через {retry_in} хв")
+        return datetime.now() + timedelta(minutes=retry_in)
+
+    def _next_sleep_interval(self) -> float:
+        """Адаптивний інтервал: спимо довше, коли до наступного вікна ще далеко"""
+        if self.state == State.PAUSED_WAITING and self.pause_start_time:
+            # На паузі - спимо прямо до моменту RESUME
+            resume_at = self.pause_start_time + timedelta(minutes=WAIT_AFTER)
+            remaining = (resume_at - datetime.now()).total_seconds()
+            return max(5, min(CHECK_INTERVAL, remaining))
+
+        # До точки паузи далеко - прокидаємось на половині шляху
+        return max(5, min(CHECK_INTERVAL, int(self.dtek.seconds_until_next_action() / 2)))
+
     @staticmethod
     def _get_next_midnight() -> datetime:
         """Отримати час наступної ночи 00:00"""
@@ -361,10 +606,13 @@ class PrinterPowerManager:
             print("❌ Помилка при припаркуванні")
         
         print("\n2️⃣  ЧЕКАЮ 60 СЕКУНД...")
-        for i in range(60, 0, -1):
-            if i % 10 == 0 or i <= 5:
-                print(f"⏳ Залишилось {i} сек...")
-            time.sleep(1)
+        # Спимо одразу до наступної позначки замість 60 wakeup'ів по 1 сек
+        milestones = [60, 50, 40, 30, 20, 10, 5, 4, 3, 2, 1]
+        for prev, cur in zip(milestones, milestones[1:]):
+            print(f"⏳ Залишилось {prev} сек...")
+            time.sleep(prev - cur)
+        print(f"⏳ Залишилось 1 сек...")
+        time.sleep(1)
         
         print("\n3️⃣  ЗАПУСКАЮ RESUME...")
         if self.moonraker.resume_print():